@@ -4,7 +4,7 @@ from __future__ import annotations
 import operator
 import re
 from dataclasses import dataclass, field
-from typing import Iterable, List, Optional
+from typing import Iterable, List, Optional, Pattern
 
 
 @dataclass(frozen=True)
@@ -38,10 +38,14 @@ class CategoryRule:
     category: str
     category_type: str = field(default="", compare=False)
     amount_condition: AmountCondition | None = field(default=None, compare=False)
+    _regex: Pattern[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._regex = re.compile(self.pattern, re.IGNORECASE)
 
     def matches(self, transaction: dict) -> bool:
         target = transaction.get(self.field, "") or ""
-        if not re.search(self.pattern, target, flags=re.IGNORECASE):
+        if not self._regex.search(target):
             return False
         if self.amount_condition:
             amount_value = _coerce_amount(transaction.get("amount"))
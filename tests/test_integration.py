@@ -1,6 +1,10 @@
 """Integration tests that verify end-to-end logical behavior."""
 import datetime as dt
-from datetime import timezone
+from collections import namedtuple
+from datetime import timedelta, timezone
+from functools import cache
+
+import pytest
 
 from bank_sync.akahu_client import AkahuTransaction
 from bank_sync.categoriser import Categoriser
@@ -8,8 +12,186 @@ from bank_sync.ignore_rules import IgnoreRule
 from bank_sync.main import _needs_update
 from bank_sync.sheets_client import TRANSACTION_HEADERS
 
+UTC = timezone.utc
+IMPORTED_AT_FIXTURE = dt.datetime(2025, 11, 15, 10, 0, 0, tzinfo=UTC)
+
+_IGNORE_RULES = (
+    IgnoreRule(
+        pattern="INTEREST ADJUSTMENT",
+        field_name="description_raw",
+        max_amount=1.00
+    ),
+)
+
+RULES_NEW_WORLD = (
+    {
+        "pattern": "new world",
+        "field": "merchant_normalised",
+        "category": "Groceries",
+        "category_type": "E",
+        "priority": 10,
+        "amount_condition": ">20",
+    },
+    {
+        "pattern": "new world",
+        "field": "merchant_normalised",
+        "category": "Snacks",
+        "category_type": "W",
+        "priority": 20,
+        "amount_condition": "",
+    },
+)
+
+RULES_RECATEGORISED = (
+    {
+        "pattern": "new world",
+        "category": "Groceries",
+        "category_type": "E",  # Changed from W to E
+        "priority": 10,
+        "amount_condition": ">20",
+    },
+)
+
+RULES_PRIORITY = (
+    {
+        "pattern": "countdown",
+        "category": "Specific Store",
+        "category_type": "E",
+        "priority": 5,  # Higher precedence
+    },
+    {
+        "pattern": "count",
+        "category": "Generic Match",
+        "category_type": "W",
+        "priority": 100,  # Lower precedence
+    },
+)
+
+RULES_AMOUNT_CONDITION = (
+    {
+        "pattern": "transfer",
+        "category": "Large Transfer",
+        "category_type": "Sl",
+        "priority": 10,
+        "amount_condition": ">100",
+    },
+    {
+        "pattern": "transfer",
+        "category": "Small Transfer",
+        "category_type": "Sl",
+        "priority": 20,
+        "amount_condition": "",
+    },
+)
+
+CategoriserCase = namedtuple("CategoriserCase", "rules txn expected_category expected_type")
+
+CASES = (
+    # Should match first rule due to amount > 20
+    CategoriserCase(
+        RULES_NEW_WORLD,
+        {"merchant_normalised": "New World", "amount": "-25.50"},
+        "Groceries",
+        "E",
+    ),
+    # Falls through to the unconditional rule
+    CategoriserCase(
+        RULES_NEW_WORLD,
+        {"merchant_normalised": "New World", "amount": "-15.00"},
+        "Snacks",
+        "W",
+    ),
+    # Lower priority numbers take precedence
+    CategoriserCase(
+        RULES_PRIORITY,
+        {"merchant_normalised": "Countdown Supermarket"},
+        "Specific Store",
+        "E",
+    ),
+    # Amount conditions use absolute values (150 and 50)
+    CategoriserCase(
+        RULES_AMOUNT_CONDITION,
+        {"merchant_normalised": "Transfer", "amount": "-150.00"},
+        "Large Transfer",
+        "Sl",
+    ),
+    CategoriserCase(
+        RULES_AMOUNT_CONDITION,
+        {"merchant_normalised": "Transfer", "amount": "-50.00"},
+        "Small Transfer",
+        "Sl",
+    ),
+)
+
+HEADER_IDX = {header: index for index, header in enumerate(TRANSACTION_HEADERS)}
+
+# Existing sheet rows, in TRANSACTION_HEADERS order.
+NEW_WORLD_SHEET_ROW = (
+    "txn_123",
+    "2025-11-15",
+    "Cheque",
+    "-25.50",
+    "100.00",
+    "NEW WORLD KARORI",
+    "New World",
+    "Snacks",  # Old category
+    "W",  # Old category_type
+    "FALSE",
+    "akahu_bnz",
+    "2025-11-15T10:00:00+00:00",
+)
+
+COFFEE_SHEET_ROW = (
+    "txn_123",
+    "2025-11-15",
+    "Cheque",
+    "-25.50",
+    "100.00",
+    "Coffee Shop",
+    "Mojo Coffee",
+    "Eating Out",
+    "W",
+    "FALSE",
+    "akahu_bnz",
+    "2025-11-15T10:00:00+00:00",
+)
+
+
+@cache
+def _categoriser_for(frozen_rules):
+    """Return a shared :class:`Categoriser` for a hashable rule set."""
+    return Categoriser(dict(rule) for rule in frozen_rules)
+
+
+def _categoriser(rules):
+    return _categoriser_for(tuple(tuple(sorted(rule.items())) for rule in rules))
+
 
-def test_transaction_flow_from_akahu_to_sheet_row():
+@pytest.fixture(scope="module")
+def new_world_categoriser():
+    return _categoriser(RULES_NEW_WORLD)
+
+
+@pytest.fixture(scope="module")
+def recategorised_categoriser():
+    return _categoriser(RULES_RECATEGORISED)
+
+
+@pytest.fixture(scope="module")
+def empty_categoriser():
+    return _categoriser(())
+
+
+def _fmt_amount(value):
+    return f"{value:.2f}"
+
+
+def _row_to_dict(row):
+    """Return the header -> value mapping ``_needs_update`` compares against."""
+    return dict(zip(TRANSACTION_HEADERS, row))
+
+
+def test_transaction_flow_from_akahu_to_sheet_row(new_world_categoriser):
     """Verify a transaction flows correctly through the entire pipeline."""
     # Step 1: Create an Akahu transaction
     akahu_payload = {
@@ -34,30 +216,11 @@ def test_transaction_flow_from_akahu_to_sheet_row():
     assert txn.merchant_normalised == "New World"
     
     # Step 2: Categorize the transaction
-    rules = [
-        {
-            "pattern": "new world",
-            "field": "merchant_normalised",
-            "category": "Groceries",
-            "category_type": "E",
-            "priority": 10,
-            "amount_condition": ">20",
-        },
-        {
-            "pattern": "new world",
-            "field": "merchant_normalised",
-            "category": "Snacks",
-            "category_type": "W",
-            "priority": 20,
-            "amount_condition": "",
-        }
-    ]
-    
-    categoriser = Categoriser(rules)
+    categoriser = new_world_categoriser
     transaction_dict = {
         "merchant_normalised": txn.merchant_normalised,
         "description_raw": txn.description_raw,
-        "amount": f"{txn.amount:.2f}",
+        "amount": _fmt_amount(txn.amount),
     }
     
     category, category_type = categoriser.categorise(transaction_dict)
@@ -69,12 +232,11 @@ def test_transaction_flow_from_akahu_to_sheet_row():
     assert is_transfer is False  # Not a transfer
     
     # Step 4: Convert to sheet row
-    imported_at = dt.datetime(2025, 11, 15, 10, 0, 0, tzinfo=timezone.utc)
     row = txn.to_row(
         category=category,
         category_type=category_type,
         is_transfer=is_transfer,
-        imported_at=imported_at
+        imported_at=IMPORTED_AT_FIXTURE
     )
     
     # Verify row structure matches headers
@@ -89,18 +251,15 @@ def test_transaction_flow_from_akahu_to_sheet_row():
     assert row[9] == "FALSE"  # is_transfer
 
 
-def test_ignore_rules_filter_small_transactions():
-    """Verify ignore rules properly filter out noise transactions."""
-    ignore_rules = [
-        IgnoreRule(
-            pattern="INTEREST ADJUSTMENT",
-            field_name="description_raw",
-            max_amount=1.00
-        )
-    ]
-    
-    # Should be ignored (matches pattern and under threshold)
-    small_interest = AkahuTransaction(
+@pytest.fixture(scope="module")
+def ignore_rules():
+    return _IGNORE_RULES
+
+
+@pytest.fixture(scope="module")
+def small_interest_txn():
+    """Matches the ignore pattern and is under the threshold."""
+    return AkahuTransaction(
         id="txn_1",
         date="2025-11-15",
         account="Cheque",
@@ -110,11 +269,12 @@ def test_ignore_rules_filter_small_transactions():
         merchant_normalised="",
         source="akahu_bnz"
     )
-    
-    assert ignore_rules[0].matches(small_interest) is True
-    
-    # Should NOT be ignored (amount too large)
-    large_interest = AkahuTransaction(
+
+
+@pytest.fixture(scope="module")
+def large_interest_txn():
+    """Matches the ignore pattern but the amount is too large."""
+    return AkahuTransaction(
         id="txn_2",
         date="2025-11-15",
         account="Cheque",
@@ -124,11 +284,12 @@ def test_ignore_rules_filter_small_transactions():
         merchant_normalised="",
         source="akahu_bnz"
     )
-    
-    assert ignore_rules[0].matches(large_interest) is False
-    
-    # Should NOT be ignored (doesn't match pattern)
-    normal_txn = AkahuTransaction(
+
+
+@pytest.fixture(scope="module")
+def normal_txn():
+    """Doesn't match the ignore pattern."""
+    return AkahuTransaction(
         id="txn_3",
         date="2025-11-15",
         account="Cheque",
@@ -138,40 +299,29 @@ def test_ignore_rules_filter_small_transactions():
         merchant_normalised="Mojo Coffee",
         source="akahu_bnz"
     )
-    
-    assert ignore_rules[0].matches(normal_txn) is False
 
 
-def test_recategorization_updates_existing_transactions():
+@pytest.mark.parametrize(
+    "txn_fixture, expected",
+    [
+        ("small_interest_txn", True),
+        ("large_interest_txn", False),
+        ("normal_txn", False),
+    ],
+)
+def test_ignore_rules_filter_small_transactions(ignore_rules, request, txn_fixture, expected):
+    """Verify ignore rules properly filter out noise transactions."""
+    txn = request.getfixturevalue(txn_fixture)
+    assert ignore_rules[0].matches(txn) is expected
+
+
+def test_recategorization_updates_existing_transactions(recategorised_categoriser):
     """Verify that changing category rules updates existing transactions."""
     # Existing transaction in sheet
-    existing_data = dict(zip(TRANSACTION_HEADERS, [
-        "txn_123",
-        "2025-11-15",
-        "Cheque",
-        "-25.50",
-        "100.00",
-        "NEW WORLD KARORI",
-        "New World",
-        "Snacks",  # Old category
-        "W",  # Old category_type
-        "FALSE",
-        "akahu_bnz",
-        "2025-11-15T10:00:00+00:00"
-    ]))
-    
+    existing_data = _row_to_dict(NEW_WORLD_SHEET_ROW)
+
     # New categorization with updated rules
-    new_rules = [
-        {
-            "pattern": "new world",
-            "category": "Groceries",
-            "category_type": "E",  # Changed from W to E
-            "priority": 10,
-            "amount_condition": ">20",
-        }
-    ]
-    
-    categoriser = Categoriser(new_rules)
+    categoriser = recategorised_categoriser
     txn_dict = {
         "merchant_normalised": "New World",
         "amount": "-25.50"
@@ -180,142 +330,51 @@ def test_recategorization_updates_existing_transactions():
     new_category, new_category_type = categoriser.categorise(txn_dict)
     
     # Build new row with updated categorization
-    new_row = list(existing_data.values())
-    new_row[7] = new_category
-    new_row[8] = new_category_type
+    new_row = list(NEW_WORLD_SHEET_ROW)
+    new_row[HEADER_IDX["category"]] = new_category
+    new_row[HEADER_IDX["category_type"]] = new_category_type
     
     # Should detect that update is needed
     assert _needs_update(existing_data, new_row) is True
-    assert new_row[7] == "Groceries"
-    assert new_row[8] == "E"
+    assert new_row[HEADER_IDX["category"]] == "Groceries"
+    assert new_row[HEADER_IDX["category_type"]] == "E"
 
 
-def test_transfer_detection_works_across_fields():
+@pytest.mark.parametrize(
+    "description_raw, merchant_normalised, expected",
+    [
+        ("Savings Account INTERNET XFR", "", True),  # Transfer in description
+        ("Regular payment", "BNZ Internal", True),  # Transfer in merchant
+        ("Self transfer to savings", "", True),  # Transfer keyword variations
+        ("Coffee purchase", "Mojo Coffee", False),  # Not a transfer
+    ],
+)
+def test_transfer_detection_works_across_fields(
+    empty_categoriser, description_raw, merchant_normalised, expected
+):
     """Verify transfer detection checks multiple fields."""
-    categoriser = Categoriser([])
-    
-    # Transfer in description
-    assert categoriser.detect_transfer({
-        "description_raw": "Savings Account INTERNET XFR",
-        "merchant_normalised": ""
-    }) is True
-    
-    # Transfer in merchant
-    assert categoriser.detect_transfer({
-        "description_raw": "Regular payment",
-        "merchant_normalised": "BNZ Internal"
-    }) is True
-    
-    # Transfer keyword variations
-    assert categoriser.detect_transfer({
-        "description_raw": "Self transfer to savings",
-        "merchant_normalised": ""
-    }) is True
-    
-    # Not a transfer
-    assert categoriser.detect_transfer({
-        "description_raw": "Coffee purchase",
-        "merchant_normalised": "Mojo Coffee"
-    }) is False
-
-
-def test_priority_ordering_in_categorization():
-    """Verify that lower priority numbers take precedence."""
-    rules = [
-        {
-            "pattern": "countdown",
-            "category": "Specific Store",
-            "category_type": "E",
-            "priority": 5,  # Higher precedence
-        },
-        {
-            "pattern": "count",
-            "category": "Generic Match",
-            "category_type": "W",
-            "priority": 100,  # Lower precedence
-        },
-    ]
-    
-    categoriser = Categoriser(rules)
-    
-    # Should match the more specific rule first
-    txn = {"merchant_normalised": "Countdown Supermarket"}
-    category, category_type = categoriser.categorise(txn)
-    
-    assert category == "Specific Store"
-    assert category_type == "E"
+    assert empty_categoriser.detect_transfer({
+        "description_raw": description_raw,
+        "merchant_normalised": merchant_normalised,
+    }) is expected
 
 
-def test_amount_condition_uses_absolute_values():
-    """Verify that amount conditions work with negative values."""
-    rules = [
-        {
-            "pattern": "transfer",
-            "category": "Large Transfer",
-            "category_type": "Sl",
-            "priority": 10,
-            "amount_condition": ">100",
-        },
-        {
-            "pattern": "transfer",
-            "category": "Small Transfer",
-            "category_type": "Sl",
-            "priority": 20,
-            "amount_condition": "",
-        }
-    ]
-    
-    categoriser = Categoriser(rules)
-    
-    # Negative amount with absolute value > 100
-    txn_large = {
-        "merchant_normalised": "Transfer",
-        "amount": "-150.00"  # Absolute value is 150
-    }
-    category, _ = categoriser.categorise(txn_large)
-    assert category == "Large Transfer"
-    
-    # Negative amount with absolute value < 100
-    txn_small = {
-        "merchant_normalised": "Transfer",
-        "amount": "-50.00"  # Absolute value is 50
-    }
-    category, _ = categoriser.categorise(txn_small)
-    assert category == "Small Transfer"
+@pytest.mark.parametrize("case", CASES, ids=lambda c: c.expected_category)
+def test_categoriser_cases(case):
+    """Verify rule priority and amount conditions pick the expected category."""
+    category, category_type = _categoriser(case.rules).categorise(case.txn)
+
+    assert category == case.expected_category
+    assert category_type == case.expected_type
 
 
 def test_transaction_deduplication_by_id():
     """Verify that transactions with same ID are treated as updates, not duplicates."""
-    existing_data = dict(zip(TRANSACTION_HEADERS, [
-        "txn_123",
-        "2025-11-15",
-        "Cheque",
-        "-25.50",
-        "100.00",
-        "Coffee Shop",
-        "Mojo Coffee",
-        "Eating Out",
-        "W",
-        "FALSE",
-        "akahu_bnz",
-        "2025-11-15T10:00:00+00:00"
-    ]))
-    
+    existing_data = _row_to_dict(COFFEE_SHEET_ROW)
+
     # Same transaction ID but with updated balance (Akahu mutated it)
-    new_row = [
-        "txn_123",  # Same ID
-        "2025-11-15",
-        "Cheque",
-        "-25.50",
-        "99.50",  # Updated balance
-        "Coffee Shop",
-        "Mojo Coffee",
-        "Eating Out",
-        "W",
-        "FALSE",
-        "akahu_bnz",
-        "2025-11-15T10:00:00+00:00"
-    ]
+    new_row = list(COFFEE_SHEET_ROW)
+    new_row[HEADER_IDX["balance"]] = "99.50"
     
     # Should detect that update is needed due to balance change
     assert _needs_update(existing_data, new_row) is True
@@ -323,10 +382,8 @@ def test_transaction_deduplication_by_id():
 
 def test_lookback_buffer_calculation():
     """Verify that lookback buffer allows catching late-settling transactions."""
-    from datetime import timedelta
-    
     # Simulate last sync was 1 day ago
-    last_sync = dt.datetime(2025, 11, 16, 12, 0, 0, tzinfo=timezone.utc)
+    last_sync = dt.datetime(2025, 11, 16, 12, 0, 0, tzinfo=UTC)
     lookback_buffer_days = 3
     
     # With buffer, should look back 3 days from last sync